@@ -13,14 +13,69 @@ Usage:
     or similar serverless architecture, to process incoming requests and route them appropriately.
 """
 
+import os
 import re
-import json
 import logging
 import importlib
 from utils.event_utils import EventUtils
 from src.routes import ROUTES
+from src._routes_dispatch import dispatch
+
+# LOG_LEVEL is set per stage in serverless.yml; applying it here at import
+# time means warm invocations never touch logging configuration again. An
+# unknown level name must degrade to the default, not fail every cold start.
+logger = logging.getLogger(__name__)
+try:
+    logger.setLevel((os.environ.get("LOG_LEVEL") or "WARNING").upper())
+except ValueError:
+    logger.setLevel(logging.WARNING)
+
+# Literal routes are dispatched through the generated comparison ladder in
+# src/_routes_dispatch.py (regenerated at package time from ROUTES). Anything
+# that is a real pattern stays compiled here and is only tried on a miss.
+_DYNAMIC_ROUTES = tuple(
+    (re.compile(key), value) for key, value in ROUTES.items() if re.escape(key) != key
+)
+
+# Controller classes are resolved lazily: the first request for a route pays
+# the module import (pulling in that controller's dependency graph), and the
+# class is cached here so every later invocation is a single dict lookup.
+# Cold starts that never reach a given route never import its dependencies.
+_CONTROLLERS = {}
+
+# Pre-encoded 404 response; the body never changes, so json.dumps-ing it on
+# every miss would re-serialize the same bytes.
+_NOT_FOUND_RESPONSE = {
+    "statusCode": 404,
+    "body": '{"message": "Resource not found!"}',
+}
+
+# Returned when the event is missing the routing fields entirely, e.g. a
+# non-proxy invocation reaching the HTTP handler.
+_BAD_REQUEST_RESPONSE = {
+    "statusCode": 400,
+    "body": '{"message": "Bad request!"}',
+}
+
+
+def _resolve_controller(name: str):
+    """
+    Resolves a controller class by name, importing its module on first use.
+
+    Args:
+        name (str): The controller name from the route table (e.g., "Login").
 
-logging.getLogger().setLevel(logging.INFO)
+    Returns:
+        type or None: The controller class, or None if the name is unknown.
+    """
+    class_ = _CONTROLLERS.get(name)
+    if class_ is None and name is not None:
+        module = importlib.import_module(
+            "src.controllers." + name.lower() + "_controller"
+        )
+        class_ = getattr(module, name + "Controller")
+        _CONTROLLERS[name] = class_
+    return class_
 
 
 def get_controller(resource: str, request_type: str):
@@ -34,9 +89,12 @@ def get_controller(resource: str, request_type: str):
     Returns:
         str or None: The name of the controller class if a match is found, otherwise None.
     """
-    for key, value in ROUTES.items():
-        if re.match(key, resource):
-            return value[request_type]
+    controller = dispatch(str(resource).rstrip("/"), request_type)
+    if controller:
+        return controller
+    for pattern, dynamic_methods in _DYNAMIC_ROUTES:
+        if pattern.match(resource):
+            return dynamic_methods.get(request_type)
     return None
 
 
@@ -51,48 +109,46 @@ def handle(event: dict, context) -> dict:
     Returns:
         dict: The response object, containing a status code and body.
     """
-    logging.info("Entered with event - %s", event)
-
-    # Initialize the EventUtils to help extract useful event data
-    event_utils = EventUtils(event)
-
-    # Extract resource path and log it
-    resource = event_utils.get_resource()
-    logging.info("Resource: %s", resource)
-
-    # Extract the HTTP method and log it
-    request_type = event_utils.get_request_type()
-    logging.info("Request-type: %s", request_type)
+    # Stringifying the whole event is expensive, so only do it when debugging
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Entered with event - %s", event)
+
+    # Pull the routing fields straight off the event: both always come from
+    # the same dict, so inline probes beat a round of accessor calls
+    resource = event.get("path")
+    request_type = event.get("httpMethod")
+
+    if not resource or not request_type:
+        logger.warning(
+            "Malformed request: path=%s, httpMethod=%s", resource, request_type
+        )
+        return _BAD_REQUEST_RESPONSE
 
     # Retrieve the AWS request ID from the context object
     pid = context.aws_request_id
 
     # Determine the correct controller for the given resource and request type
     controller = get_controller(resource=resource, request_type=request_type)
-    logging.info("Controller - %s", controller)
+    logger.debug("Routing %s %s to controller %s", request_type, resource, controller)
 
     response = {}
 
-    if controller:
-        # Dynamically import and instantiate the controller class
-        module = importlib.import_module(
-            "src.controllers." + controller.lower() + "_controller"
-        )
-        class_ = getattr(module, controller + "Controller")
-        instance = class_(event, pid)
+    # Resolve the controller class (imported on first use, cached after)
+    class_ = _resolve_controller(controller)
 
-        # Execute the controller and store the response
-        response = instance.execute()
+    if class_:
+        # Parse the body once here and hand the controller the plain dict,
+        # so no second EventUtils is ever built around the same event
+        body = EventUtils(event).get_body()
+        response = class_(body, pid).execute()
 
     else:
         # Handle case where no matching resource is found
-        logging.info("No resource matched: provided resource is: %s", resource)
-        response = {
-            "statusCode": 404,
-            "body": json.dumps({"message": "Resource not found!"}),
-        }
-
-    # Log the final response
-    logging.info("Response: %s", response)
+        logger.warning("No resource matched: provided resource is: %s", resource)
+        response = _NOT_FOUND_RESPONSE
+
+    # Log the final response only when debugging; it is rebuilt as a string
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Response: %s", response)
 
     return response
@@ -0,0 +1,80 @@
+"""
+Route Dispatch Generator
+
+This script reads the literal routes from `src/routes.py` and emits
+`src/_routes_dispatch.py`, a module whose `dispatch` function resolves a
+(resource, method) pair through an explicit comparison ladder. The generated
+code dispatches with bytecode-level jumps on interned string literals, so
+request routing performs no regex work and no dict iteration at runtime.
+
+Routes containing regex metacharacters are left out; the handler still falls
+back to its compiled dynamic patterns for those.
+
+Usage:
+    python scripts/generate_routes_dispatch.py
+
+Run it whenever ROUTES changes; the serverless packaging hook also runs it
+before every deploy so the generated module can never go stale in a shipped
+artifact.
+"""
+
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.routes import ROUTES
+
+_OUTPUT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "src",
+    "_routes_dispatch.py",
+)
+
+_HEADER = '''"""
+Generated route dispatch table. DO NOT EDIT.
+
+Regenerate with `python scripts/generate_routes_dispatch.py` after changing
+src/routes.py.
+"""
+
+
+def dispatch(resource, method):
+    """
+    Resolves a controller name for a normalized resource path and HTTP method.
+
+    Args:
+        resource (str): The request path with any trailing slash stripped.
+        method (str): The HTTP method of the request.
+
+    Returns:
+        str or None: The controller name if the pair is routed, otherwise None.
+    """
+'''
+
+
+def generate() -> str:
+    """
+    Renders the source of the dispatch module from the current ROUTES table.
+
+    Returns:
+        str: The complete source text of src/_routes_dispatch.py.
+    """
+    lines = [_HEADER]
+    for path, methods in ROUTES.items():
+        if re.escape(path) != path:
+            continue
+        lines.append(f"    if resource == {path.rstrip('/')!r}:\n")
+        for method, controller in methods.items():
+            lines.append(f"        if method == {method!r}:\n")
+            lines.append(f"            return {controller!r}\n")
+        lines.append("        return None\n")
+    lines.append("    return None\n")
+    return "".join(lines)
+
+
+if __name__ == "__main__":
+    with open(_OUTPUT_PATH, "w", encoding="utf-8") as output:
+        output.write(generate())
+    print(f"Wrote {_OUTPUT_PATH}")
@@ -0,0 +1,24 @@
+"""
+Generated route dispatch table. DO NOT EDIT.
+
+Regenerate with `python scripts/generate_routes_dispatch.py` after changing
+src/routes.py.
+"""
+
+
+def dispatch(resource, method):
+    """
+    Resolves a controller name for a normalized resource path and HTTP method.
+
+    Args:
+        resource (str): The request path with any trailing slash stripped.
+        method (str): The HTTP method of the request.
+
+    Returns:
+        str or None: The controller name if the pair is routed, otherwise None.
+    """
+    if resource == '/user/login':
+        if method == 'POST':
+            return 'Login'
+        return None
+    return None
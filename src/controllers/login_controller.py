@@ -1,9 +1,9 @@
 """
 Login Controller Module
 
-This module handles the login process for incoming requests. It utilizes `LoginSchema` 
-to validate the login request data and performs basic authentication. If validation fails, 
-appropriate error responses are returned.
+This module handles the login process for incoming requests. It validates the
+login request data against a compiled JSON schema and performs basic
+authentication. If validation fails, appropriate error responses are returned.
 
 Classes:
     - LoginController: Manages the validation and authentication of login requests.
@@ -13,11 +13,36 @@ Usage:
     Call the `execute` method to process the login request and return the appropriate response.
 """
 
+import hmac
 import json
+import hashlib
 import logging
-from marshmallow import ValidationError
-from utils.event_utils import EventUtils
-from src.models.login_schema import LoginSchema
+import fastjsonschema
+
+logger = logging.getLogger(__name__)
+
+# Digest of the (for now hardcoded) expected password, computed once at
+# import so each auth check only hashes the supplied password and compares
+# digests in constant time.
+_EXPECTED_PASSWORD_DIGEST = hashlib.sha256(b"strongpassword").digest()
+
+# Static response bodies, pre-encoded once; the 422 body embeds the
+# validator's message and is the only one encoded per request.
+_BODY_SUCCESS = '{"message": "Login successful!"}'
+_BODY_BAD_CREDENTIALS = '{"message": "Either email or password is incorrect!"}'
+
+# fastjsonschema compiles the schema into plain Python once at import time, so
+# each request runs the generated validator instead of walking schema fields.
+_VALIDATE_LOGIN = fastjsonschema.compile(
+    {
+        "type": "object",
+        "required": ["email", "password"],
+        "properties": {
+            "email": {"type": "string", "format": "email"},
+            "password": {"type": "string"},
+        },
+    }
+)
 
 
 class LoginController:
@@ -27,36 +52,33 @@ class LoginController:
     Handles the login request by validating the request body and authenticating the user.
 
     Attributes:
-        event (dict): The event data containing the login request.
+        body (dict): The parsed request body, containing login credentials.
         pid (str): The process ID associated with the current request.
-        body (dict): The parsed body of the event, containing login credentials.
 
     Methods:
         _authenticate: Authenticates the user based on the provided email and password.
         execute: Validates the request body, attempts to authenticate the user, and returns a response.
     """
 
-    def __init__(self, event, pid) -> None:
+    def __init__(self, body, pid) -> None:
         """
-        Initializes the LoginController with the event and process ID.
+        Initializes the LoginController with the parsed request body and process ID.
 
         Args:
-            event (dict): The event containing the login request.
+            body (dict): The parsed request body containing the login credentials.
             pid (str): The process ID associated with the current request.
-
-        Initializes:
-            body (dict): Parsed request body data from the event.
         """
-        event_utils = EventUtils(event)
-        self.body = event_utils.get_body()
+        self.body = body
         self.pid = pid
 
     def _authenticate(self):
         """
         Private method to authenticate the login credentials.
 
-        Checks if the provided email and password match the hardcoded credentials.
-        For now, the password is hardcoded as "strongpassword".
+        Hashes the supplied password and compares it against the expected
+        digest with hmac.compare_digest, so the comparison takes the same
+        time whether or not (and where) the passwords differ. For now, the
+        expected password is hardcoded as "strongpassword".
 
         Returns:
             bool: True if authentication is successful, False otherwise.
@@ -64,39 +86,39 @@ class LoginController:
         email = self.body["email"]
         password = self.body["password"]
 
-        if email and password == "strongpassword":
-            return True
-        return False
+        provided_digest = hashlib.sha256(password.encode()).digest()
+        return bool(email) and hmac.compare_digest(
+            provided_digest, _EXPECTED_PASSWORD_DIGEST
+        )
 
     def execute(self):
         """
         Main method to execute the login process.
 
-        This method validates the incoming request body using the `LoginSchema`.
-        If validation passes, it attempts to authenticate the user. Depending on
-        the outcome of the authentication, it returns a success or failure response.
+        This method validates the incoming request body against the compiled
+        login schema. If validation passes, it attempts to authenticate the user.
+        Depending on the outcome of the authentication, it returns a success or
+        failure response.
 
         Returns:
             dict: A dictionary containing the HTTP status code and response body.
         """
         try:
-            schema = LoginSchema()
-            schema.load(self.body)
-        except ValidationError as ve:
-            logging.error(ve)
-            missing_keys = str(list(ve.normalized_messages().keys()))
+            _VALIDATE_LOGIN(self.body)
+        except fastjsonschema.JsonSchemaException as ve:
+            logger.error(ve)
             return {
                 "statusCode": 422,
-                "body": json.dumps({"message": f"{missing_keys} are missing!"}),
+                "body": json.dumps({"message": ve.message}),
             }
 
         if self._authenticate():
             return {
                 "statusCode": 200,
-                "body": json.dumps({"message": "Login successful!"}),
+                "body": _BODY_SUCCESS,
             }
 
         return {
             "statusCode": 403,
-            "body": json.dumps({"message": "Either email or password is incorrect!"}),
+            "body": _BODY_BAD_CREDENTIALS,
         }
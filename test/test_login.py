@@ -15,16 +15,10 @@ Usage:
 """
 
 from unittest import TestCase
-import os
-import sys
 import json
 import warnings
 from handler import handle
 
-# Adjusting the import path to include the parent directory for the handler module
-test_path = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, test_path + "/../")
-
 
 def ignore_warnings(test_func):
     """Decorator to filter out the warnings in tests
@@ -122,3 +116,29 @@ class TestLogin(TestCase):
         event = EventContext().event
         response = handle(event, Context("from_integration_testcase"))
         self.assertEqual(response["statusCode"], 200)
+
+    @ignore_warnings
+    def test_malformed_event(self):
+        """
+        Tests the handling of an event without the routing fields.
+
+        Ensures that the Lambda handler returns a 400 status code when the
+        event carries no path or HTTP method.
+        """
+        response = handle({}, Context("from_integration_testcase"))
+        self.assertEqual(response["statusCode"], 400)
+        self.assertEqual(json.loads(response["body"]), {"message": "Bad request!"})
+
+    @ignore_warnings
+    def test_invalid_body(self):
+        """
+        Tests the handling of a login request with a missing credential.
+
+        Ensures that the Lambda handler returns a 422 status code with a
+        well-formed JSON body naming the missing field.
+        """
+        event = EventContext().event
+        event["body"] = json.dumps({"email": "test@gmail.com"})
+        response = handle(event, Context("from_integration_testcase"))
+        self.assertEqual(response["statusCode"], 422)
+        self.assertIn("password", json.loads(response["body"])["message"])
@@ -16,15 +16,26 @@ Usage:
     query_params = event_utils.get_query_params()
 """
 
-import json
 import logging
 
+# orjson parses in C and is shipped via a Lambda layer; fall back to the
+# stdlib when the layer is absent, e.g. in local test runs.
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+logger = logging.getLogger(__name__)
+
 
 class EventUtils:
     """
     A utility class for extracting data from event objects in API-driven
     applications.
 
+    Extracted values are cached on the instance, so repeated calls (or several
+    collaborators sharing one instance) never re-parse the same event data.
+
     Attributes:
         event (dict): The event object containing request details.
 
@@ -44,12 +55,14 @@ class EventUtils:
             event (dict): The event object received by the API handler.
         """
         self.event = event
+        self._body = None
 
     def get_body(self) -> dict:
         """
         Parses and returns the body of the event as a dictionary.
 
-        Logs an info message if the body is found, and raises a ValueError if the body is empty.
+        The parsed body is cached, so the JSON is decoded at most once per
+        instance. Raises a ValueError if the body is empty.
 
         Returns:
             dict: Parsed body of the event.
@@ -57,11 +70,16 @@ class EventUtils:
         Raises:
             ValueError: If the body is empty or not provided.
         """
-        body = self.event.get("body", {})
-        logging.info("Received body - %s", body)
+        if self._body is not None:
+            return self._body
+        try:
+            body = self.event["body"]
+        except KeyError:
+            body = None
         if body:
-            return json.loads(body)
-        logging.error("Body was empty")
+            self._body = _json.loads(body)
+            return self._body
+        logger.error("Body was empty")
         raise ValueError("Body was empty")
 
     def get_resource(self):
@@ -71,23 +89,29 @@ class EventUtils:
         Returns:
             str or int: The request path if present, otherwise 404.
         """
-        if self.event.get("path", None):
-            return self.event.get("path")
-        logging.error("Resource not found in the request")
+        try:
+            resource = self.event["path"]
+            if resource:
+                return resource
+        except KeyError:
+            pass
+        logger.error("Resource not found in the request")
         return 404
 
     def get_request_origin(self):
         """
         Retrieves the origin of the request from the headers.
 
+        Header names are matched case-insensitively by scanning for the one
+        key, rather than lowercasing and copying the whole header dict.
+
         Returns:
             str: The origin of the request if present in the headers.
         """
-        request_headers = self.event.get("headers", {})
-        request_headers = {key.lower(): value for key, value in request_headers.items()}
-
-        if request_headers:
-            return request_headers.get("origin")
+        request_headers = self.event.get("headers") or {}
+        for key, value in request_headers.items():
+            if key.lower() == "origin":
+                return value
 
     def get_request_type(self) -> str:
         """
@@ -101,9 +125,13 @@ class EventUtils:
         Raises:
             ValueError: If the HTTP method is not found in the event.
         """
-        if self.event.get("httpMethod", None):
-            return self.event.get("httpMethod")
-        logging.error("Request type not found in the request")
+        try:
+            request_type = self.event["httpMethod"]
+            if request_type:
+                return request_type
+        except KeyError:
+            pass
+        logger.error("Request type not found in the request")
         raise ValueError("Request type not found in the request")
 
     def get_query_params(self) -> dict:
@@ -116,7 +144,11 @@ class EventUtils:
         Raises:
             ValueError: If query parameters are not found in the event.
         """
-        if self.event.get("queryStringParameters", None):
-            return self.event.get("queryStringParameters")
-        logging.error("Query parameters not found in the request")
+        try:
+            query_params = self.event["queryStringParameters"]
+            if query_params:
+                return query_params
+        except KeyError:
+            pass
+        logger.error("Query parameters not found in the request")
         raise ValueError("Query parameters not found in the request")